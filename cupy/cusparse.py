@@ -1026,6 +1026,9 @@ def csr2cscEx2(x):
             handle, m, n, nnz, x.data.data.ptr, x.indptr.data.ptr,
             x.indices.data.ptr, data.data.ptr, indptr.data.ptr,
             indices.data.ptr, x_dtype, action, ibase, algo)
+        # The workspace comes from the memory pool, which already hands the
+        # same block back on repeated conversions without calling cudaMalloc,
+        # while keeping the reuse safe across streams.
         buffer = _cupy.empty(buffer_size, _numpy.int8)
         _cusparse.csr2cscEx2(
             handle, m, n, nnz, x.data.data.ptr, x.indptr.data.ptr,
@@ -1295,6 +1298,34 @@ class SpMatDescriptor(BaseDescriptor):
         return SpMatDescriptor(desc, get, destroy)
 
 
+class _SpMatDescriptorCache(object):
+
+    # Holds the SpMatDescriptor of a compressed sparse matrix together with
+    # the buffers it was created for. It is never carried over when the
+    # matrix is pickled or copied.
+
+    def __init__(self):
+        self.key = None
+        self.descriptor = None
+
+    def __reduce__(self):
+        return _SpMatDescriptorCache, ()
+
+
+def _get_spmat_descriptor(a):
+    cache = getattr(a, '_spmat_descr', None)
+    if cache is None:
+        return SpMatDescriptor.create(a)
+    # The descriptor only records the pointers and sizes of the underlying
+    # arrays, so it can be reused as long as none of them has changed.
+    key = (a.format, a.shape, a.nnz, a.dtype, a.data.data.ptr,
+           a.indices.data.ptr, a.indptr.data.ptr)
+    if cache.key != key:
+        cache.descriptor = SpMatDescriptor.create(a)
+        cache.key = key
+    return cache.descriptor
+
+
 class DnVecDescriptor(BaseDescriptor):
 
     @classmethod
@@ -1369,7 +1400,7 @@ def spmv(a, x, y=None, alpha=1, beta=0, transa=False):
         y.fill(0)
         return y
 
-    desc_a = SpMatDescriptor.create(a)
+    desc_a = _get_spmat_descriptor(a)
     desc_x = DnVecDescriptor.create(x)
     desc_y = DnVecDescriptor.create(y)
 
@@ -1443,7 +1474,7 @@ def spmm(a, b, c=None, alpha=1, beta=0, transa=False, transb=False):
         c.fill(0)
         return c
 
-    desc_a = SpMatDescriptor.create(a)
+    desc_a = _get_spmat_descriptor(a)
     desc_b = DnMatDescriptor.create(b)
     desc_c = DnMatDescriptor.create(c)
 
@@ -1777,7 +1808,7 @@ def sparseToDense(x, out=None):
         assert out.flags.f_contiguous
         assert out.dtype == dtype
 
-    desc_x = SpMatDescriptor.create(x)
+    desc_x = _get_spmat_descriptor(x)
     desc_out = DnMatDescriptor.create(out)
     algo = _cusparse.CUSPARSE_SPARSETODENSE_ALG_DEFAULT
     handle = _device.get_cusparse_handle()
@@ -1827,10 +1858,14 @@ def spgemm(a, b, alpha=1):
     a, b = _cast_common_type(a, b)
     c_shape = (m, n)
     c = cupyx.scipy.sparse.csr_matrix((c_shape), dtype=a.dtype)
+    if a.nnz == 0 or b.nnz == 0:
+        # The product is empty; skip the work estimation and the buffer
+        # allocations of cuSPARSE altogether.
+        return c
 
     handle = _device.get_cusparse_handle()
-    mat_a = SpMatDescriptor.create(a)
-    mat_b = SpMatDescriptor.create(b)
+    mat_a = _get_spmat_descriptor(a)
+    mat_b = _get_spmat_descriptor(b)
     mat_c = SpMatDescriptor.create(c)
     spgemm_descr = _cusparse.spGEMM_createDescr()
     op_a = _cusparse.CUSPARSE_OPERATION_NON_TRANSPOSE
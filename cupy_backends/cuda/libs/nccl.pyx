@@ -476,6 +476,47 @@ cdef class NcclCommunicator:
                               peer, self._comm, <driver.Stream>stream)
         check_status(status)
 
+    def _allToAll(self, sendbufs, recvbufs, size_t sendcount, int sendtype,
+                  size_t recvcount, int recvtype, intptr_t stream,
+                  int skip_peer=-1):
+        # Sends sendbufs[i] to and receives recvbufs[i] from the rank i. All
+        # the point-to-point calls are issued within a single NCCL group
+        # without going back to Python in between. The exchange with
+        # skip_peer, if given, is left to the caller.
+        cdef vector.vector[intptr_t] sends, recvs
+        cdef int i, n_peers
+        cdef ncclResult_t status
+        cdef ncclResult_t end_status = ncclSuccess
+
+        if NCCL_VERSION_CODE < 2700:
+            raise RuntimeError('ncclSend is not available in this version')
+        n_peers = len(sendbufs)
+        if len(recvbufs) != n_peers:
+            raise ValueError('sendbufs and recvbufs must have the same size')
+        for i in range(n_peers):
+            sends.push_back(sendbufs[i])
+            recvs.push_back(recvbufs[i])
+        with nogil:
+            status = ncclGroupStart()
+            if status == ncclSuccess:
+                for i in range(n_peers):
+                    if i == skip_peer:
+                        continue
+                    status = ncclSend(<void*>sends[i], sendcount,
+                                      <ncclDataType_t>sendtype, i,
+                                      self._comm, <driver.Stream>stream)
+                    if status != ncclSuccess:
+                        break
+                    status = ncclRecv(<void*>recvs[i], recvcount,
+                                      <ncclDataType_t>recvtype, i,
+                                      self._comm, <driver.Stream>stream)
+                    if status != ncclSuccess:
+                        break
+                # the group must be closed even if a call failed
+                end_status = ncclGroupEnd()
+        check_status(status)
+        check_status(end_status)
+
     def check_async_error(self):
         if NCCL_VERSION_CODE < 2400:
             raise RuntimeError('ncclCommGetAsyncError is not available'
@@ -3,6 +3,7 @@ import warnings
 
 import cupy
 from cupy.cuda import nccl
+from cupy.cuda import runtime
 from cupyx.distributed import _store
 from cupyx.distributed._comm import _Backend
 from cupyx.scipy import sparse
@@ -42,6 +43,19 @@ else:
 
     _nccl_ops = {}
 
+# Largest value sent by cpu_broadcast, it has to fit in a single store
+# message together with the key and the type markers
+_CPU_BROADCAST_MAX_BYTES = 128
+
+# Complex arrays are transferred as pairs of real numbers
+_nccl_complex_dtypes = frozenset('FD')
+
+# NCCL datatype and element count multiplier for each dtype character,
+# precomputed so that collectives only need a single lookup
+_nccl_dtypes_and_scales = {
+    dtype: (nccl_dtype, 2 if dtype in _nccl_complex_dtypes else 1)
+    for dtype, nccl_dtype in _nccl_dtypes.items()}
+
 
 class NCCLBackend(_Backend):
     """Interface that uses NVIDIA's NCCL to perform communications.
@@ -64,6 +78,8 @@ class NCCLBackend(_Backend):
                  use_mpi=False):
         super().__init__(n_devices, rank, host, port)
         self._use_mpi = _mpi_available and use_mpi
+        # Selects the store slot used by every broadcast through the store
+        self._cpu_broadcast_seq = 0
         if self._use_mpi:
             self._init_with_mpi(n_devices, rank)
         else:
@@ -74,6 +90,10 @@ class NCCLBackend(_Backend):
         # so the rank may be different than the one specified
         self._mpi_comm = MPI.COMM_WORLD
         self._mpi_rank = self._mpi_comm.Get_rank()
+        # Collectives done through MPI take the MPI rank of the root
+        self._nccl_to_mpi_rank = {
+            nccl_rank: mpi_rank for mpi_rank, nccl_rank
+            in enumerate(self._mpi_comm.allgather(rank))}
         self._mpi_comm.Barrier()
         nccl_id = None
         if self._mpi_rank == 0:
@@ -92,6 +112,11 @@ class NCCLBackend(_Backend):
             # make them positive and send them as bytes to the proxy store
             shifted_nccl_id = bytes([b + 128 for b in nccl_id])
             self._store_proxy['nccl_id'] = shifted_nccl_id
+            # Getting a key that is not set yet is an error in the store
+            # instead of blocking, so the barrier is what guarantees that
+            # the other ranks read the id only after it has been written.
+            # It adds no extra wait on this rank, as ncclCommInitRank
+            # blocks until every rank has joined anyway.
             self._store_proxy.barrier()
         else:
             self._store_proxy.barrier()
@@ -105,35 +130,35 @@ class NCCLBackend(_Backend):
                 'NCCL requires arrays to be either c- or f-contiguous')
 
     def _get_nccl_dtype_and_count(self, array, count=None):
-        dtype = array.dtype.char
-        if dtype not in _nccl_dtypes:
+        entry = _nccl_dtypes_and_scales.get(array.dtype.char)
+        if entry is None:
             raise TypeError(f'Unknown dtype {array.dtype} for NCCL')
-        nccl_dtype = _nccl_dtypes[dtype]
+        nccl_dtype, scale = entry
         if count is None:
             count = array.size
-        if dtype in 'FD':
-            return nccl_dtype, 2 * count
-        return nccl_dtype, count
+        return nccl_dtype, scale * count
 
     def _get_stream(self, stream):
         if stream is None:
-            stream = cupy.cuda.stream.get_current_stream()
+            stream = cupy.cuda.get_current_stream()
         return stream.ptr
 
     def _get_op(self, op, dtype):
-        if op not in _nccl_ops:
+        nccl_op = _nccl_ops.get(op)
+        if nccl_op is None:
             raise RuntimeError(f'Unknown op {op} for NCCL')
-        if dtype in 'FD' and op != nccl.NCCL_SUM:
+        if dtype in _nccl_complex_dtypes and nccl_op != nccl.NCCL_SUM:
             raise ValueError(
                 'Only nccl.SUM is supported for complex arrays')
-        return _nccl_ops[op]
+        return nccl_op
 
     def _dispatch_arg_type(self, function, args):
         comm_class = _DenseNCCLCommunicator
-        if (
-            (isinstance(args[0], (list, tuple))
-             and sparse.issparse(args[0][0]))
-            or sparse.issparse(args[0])
+        arg = args[0]
+        # Dense arrays are the common case, avoid the sparse checks for them
+        if type(arg) is not cupy.ndarray and (
+            (isinstance(arg, (list, tuple)) and sparse.issparse(arg[0]))
+            or sparse.issparse(arg)
         ):
             comm_class = _SparseNCCLCommunicator
         getattr(comm_class, function)(self, *args)
@@ -153,6 +178,28 @@ class NCCLBackend(_Backend):
         self._dispatch_arg_type(
             'all_reduce', (in_array, out_array, op, stream))
 
+    def all_reduce_via_rs_ag(
+            self, in_array, out_array, op='sum', stream=None):
+        """Performs an all reduce as a reduce scatter and an all gather.
+
+        The result is the same as :meth:`all_reduce`, but each rank only
+        reduces its own `1 / n_devices` shard of the data, which is written
+        in place into `out_array` and then gathered from the other ranks.
+        No intermediate buffer is allocated.
+
+        Args:
+            in_array (cupy.ndarray): array to be sent. Its size must be a
+                multiple of the number of devices.
+            out_array (cupy.ndarray): array where the result with be stored.
+            op (str): reduction operation, can be one of
+                ('sum', 'prod', 'min' 'max'), arrays of complex type only
+                support `'sum'`. Defaults to `'sum'`.
+            stream (cupy.cuda.Stream, optional): if supported, stream to
+                perform the communication.
+        """
+        self._dispatch_arg_type(
+            'all_reduce_via_rs_ag', (in_array, out_array, op, stream))
+
     def reduce(self, in_array, out_array, root=0, op='sum', stream=None):
         """Performs a reduce operation.
 
@@ -304,12 +351,93 @@ class NCCLBackend(_Backend):
         mechanism that halts the thread progression.
         """
         # implements a barrier CPU side
-        # TODO allow multiple barriers to be executed
         if self._use_mpi:
             self._mpi_comm.Barrier()
         else:
             self._store_proxy.barrier()
 
+    def cpu_broadcast(self, value, root=0):
+        """Broadcasts a small host value from the `root` rank.
+
+        The value is exchanged in the cpu, so no kernel is launched and the
+        devices are not synchronized. Like :meth:`barrier`, it halts the
+        thread progression until every rank has called it.
+
+        Args:
+            value (int or bytes): value to be sent by the `root` rank. It is
+                ignored by the other ranks. Its encoding, in bytes or as a
+                signed integer, can be at most 128 bytes long.
+            root (int, optional): rank of the process that will send the
+                value. Defaults to `0`.
+
+        Returns:
+            int or bytes: the value sent by the `root` rank.
+
+        An invalid value raises an error in all the ranks, the `root` rank
+        still takes part in the broadcast so the other ranks do not hang.
+        """
+        if not 0 <= root < self._n_devices:
+            raise ValueError(f'Invalid root rank {root}')
+        data = None
+        error = None
+        if self.rank == root:
+            try:
+                data = _encode_cpu_broadcast_value(value)
+            except (TypeError, ValueError) as e:
+                error = e
+                message = str(e).encode('utf-8')[:_CPU_BROADCAST_MAX_BYTES]
+                data = b'e' + message
+        if self._use_mpi:
+            data = self._mpi_comm.bcast(
+                data, root=self._nccl_to_mpi_rank[root])
+        else:
+            # Consecutive calls alternate between two slots so the store
+            # does not grow. The root can only overwrite a slot two calls
+            # later, after the barrier of the next call, which every rank
+            # reaches once it has read the value of this one.
+            key = f'cpu_broadcast_{self._cpu_broadcast_seq % 2}'
+            self._cpu_broadcast_seq += 1
+            if self.rank == root:
+                self._store_proxy[key] = data
+            self._store_proxy.barrier()
+            if self.rank != root:
+                data = self._store_proxy[key]
+        if error is not None:
+            raise error
+        return _decode_cpu_broadcast_value(data, root)
+
+
+def _encode_cpu_broadcast_value(value):
+    # The first byte tells the receiving ranks how to decode the value,
+    # b'e' is used instead when the root could not encode it
+    if isinstance(value, int):
+        marker = b'i'
+        value = value.to_bytes(
+            value.bit_length() // 8 + 1, 'big', signed=True)
+    elif isinstance(value, (bytes, bytearray)):
+        marker = b'b'
+        value = bytes(value)
+    else:
+        raise TypeError(
+            f'Only int and bytes can be broadcast, found '
+            f'{type(value).__name__}')
+    if len(value) > _CPU_BROADCAST_MAX_BYTES:
+        raise ValueError(
+            f'Values to broadcast are limited to '
+            f'{_CPU_BROADCAST_MAX_BYTES} bytes, found {len(value)}')
+    return marker + value
+
+
+def _decode_cpu_broadcast_value(data, root):
+    marker, value = data[:1], data[1:]
+    if marker == b'i':
+        return int.from_bytes(value, 'big', signed=True)
+    elif marker == b'b':
+        return value
+    raise RuntimeError(
+        f'cpu_broadcast failed in root rank {root}: '
+        f'{value.decode("utf-8", "replace")}')
+
 
 class _DenseNCCLCommunicator:
 
@@ -323,6 +451,37 @@ class _DenseNCCLCommunicator:
         comm._comm.allReduce(
             in_array.data.ptr, out_array.data.ptr, count, dtype, op, stream)
 
+    @classmethod
+    def all_reduce_via_rs_ag(
+            cls, comm, in_array, out_array, op='sum', stream=None):
+        comm._check_contiguous(in_array)
+        comm._check_contiguous(out_array)
+        # The shard offsets are computed on out_array, so it must have the
+        # same layout as in_array to avoid writing out of bounds
+        if (out_array.size != in_array.size
+                or out_array.dtype != in_array.dtype):
+            raise ValueError(
+                f'all_reduce_via_rs_ag requires out_array to have the size '
+                f'and dtype of in_array, found {out_array.size} '
+                f'{out_array.dtype} and {in_array.size} {in_array.dtype}')
+        if in_array.size % comm._n_devices != 0:
+            raise ValueError(
+                f'all_reduce_via_rs_ag requires the size of in_array to be '
+                f'a multiple of {comm._n_devices}, found {in_array.size}')
+        stream = comm._get_stream(stream)
+        shard = in_array.size // comm._n_devices
+        dtype, count = comm._get_nccl_dtype_and_count(in_array, shard)
+        op = comm._get_op(op, in_array.dtype.char)
+        # The reduced shard is stored in its final location, so that the
+        # all gather can run in place. Both calls are on the same stream,
+        # which orders them; they are not grouped as the all gather
+        # consumes the output of the reduce scatter.
+        shard_ptr = out_array.data.ptr + comm.rank * shard * out_array.itemsize
+        comm._comm.reduceScatter(
+            in_array.data.ptr, shard_ptr, count, dtype, op, stream)
+        comm._comm.allGather(
+            shard_ptr, out_array.data.ptr, count, dtype, stream)
+
     @classmethod
     def reduce(cls, comm, in_array, out_array, root=0, op='sum', stream=None):
         comm._check_contiguous(in_array)
@@ -392,10 +551,19 @@ class _DenseNCCLCommunicator:
         comm._check_contiguous(out_array)
         stream = comm._get_stream(stream)
         idtype, icount = comm._get_nccl_dtype_and_count(in_array)
-        odtype, ocount = comm._get_nccl_dtype_and_count(out_array)
+        if (in_array.dtype == out_array.dtype
+                and in_array.size == out_array.size):
+            # Symmetric exchange, the most common case
+            odtype, ocount = idtype, icount
+        else:
+            odtype, ocount = comm._get_nccl_dtype_and_count(out_array)
+        in_ptr = in_array.data.ptr
+        out_ptr = out_array.data.ptr
+        nccl_comm = comm._comm
+        # Keep the group free of anything but the NCCL calls
         nccl.groupStart()
-        cls._send(comm, in_array, peer, idtype, icount, stream)
-        cls._recv(comm, out_array, peer, odtype, ocount, stream)
+        nccl_comm.send(in_ptr, icount, idtype, peer, stream)
+        nccl_comm.recv(out_ptr, ocount, odtype, peer, stream)
         nccl.groupEnd()
 
     @classmethod
@@ -407,15 +575,22 @@ class _DenseNCCLCommunicator:
         comm._check_contiguous(in_array)
         comm._check_contiguous(out_array)
         stream = comm._get_stream(stream)
-        nccl.groupStart()
-        if root == comm.rank:
-            for i in range(comm._n_devices):
-                array = in_array[i]
-                idtype, icount = comm._get_nccl_dtype_and_count(array)
-                cls._send(comm, array, i, idtype, icount, stream)
         dtype, count = comm._get_nccl_dtype_and_count(out_array)
-        cls._recv(comm, out_array, root, dtype, count, stream)
+        if root != comm.rank:
+            cls._recv(comm, out_array, root, dtype, count, stream)
+            return
+        # All the shards of in_array share the same dtype and size
+        idtype, icount = comm._get_nccl_dtype_and_count(in_array[0])
+        self_copy = _is_self_copy_possible(in_array[root], out_array)
+        nccl.groupStart()
+        for i in range(comm._n_devices):
+            if i != root or not self_copy:
+                cls._send(comm, in_array[i], i, idtype, icount, stream)
+        if not self_copy:
+            cls._recv(comm, out_array, root, dtype, count, stream)
         nccl.groupEnd()
+        if self_copy:
+            _self_copy(in_array[root], out_array, stream)
 
     @classmethod
     def gather(cls, comm, in_array, out_array, root=0, stream=None):
@@ -427,20 +602,27 @@ class _DenseNCCLCommunicator:
         comm._check_contiguous(in_array)
         comm._check_contiguous(out_array)
         stream = comm._get_stream(stream)
-        nccl.groupStart()
-        if root == comm.rank:
-            for i in range(comm._n_devices):
-                array = out_array[i]
-                odtype, ocount = comm._get_nccl_dtype_and_count(array)
-                cls._recv(comm, array, i, odtype, ocount, stream)
         dtype, count = comm._get_nccl_dtype_and_count(in_array)
-        cls._send(comm, in_array, root, dtype, count, stream)
+        if root != comm.rank:
+            cls._send(comm, in_array, root, dtype, count, stream)
+            return
+        # All the shards of out_array share the same dtype and size
+        odtype, ocount = comm._get_nccl_dtype_and_count(out_array[0])
+        self_copy = _is_self_copy_possible(in_array, out_array[root])
+        nccl.groupStart()
+        for i in range(comm._n_devices):
+            if i != root or not self_copy:
+                cls._recv(comm, out_array[i], i, odtype, ocount, stream)
+        if not self_copy:
+            cls._send(comm, in_array, root, dtype, count, stream)
         nccl.groupEnd()
+        if self_copy:
+            _self_copy(in_array, out_array[root], stream)
 
     @classmethod
     def all_to_all(cls, comm, in_array, out_array, stream=None):
         # TODO(ecastill) out_array needs to have comm size in shape[0]
-        if out_array.shape[0] != comm._n_devices:
+        if in_array.shape[0] != comm._n_devices:
             raise RuntimeError(
                 f'all_to_all requires in_array to have {comm._n_devices}'
                 f'elements in its first dimension, found {in_array.shape}')
@@ -454,11 +636,31 @@ class _DenseNCCLCommunicator:
         idtype, icount = comm._get_nccl_dtype_and_count(in_array[0])
         odtype, ocount = comm._get_nccl_dtype_and_count(out_array[0])
         # TODO check out dtypes are the same as in dtypes
-        nccl.groupStart()
-        for i in range(comm._n_devices):
-            cls._send(comm, in_array[i], i, idtype, icount, stream)
-            cls._recv(comm, out_array[i], i, odtype, ocount, stream)
-        nccl.groupEnd()
+        sendbufs = [in_array[i].data.ptr for i in range(comm._n_devices)]
+        recvbufs = [out_array[i].data.ptr for i in range(comm._n_devices)]
+        rank = comm.rank
+        self_copy = _is_self_copy_possible(in_array[rank], out_array[rank])
+        # The whole group of send/recv calls is issued from Cython
+        comm._comm._allToAll(
+            sendbufs, recvbufs, icount, idtype, ocount, odtype, stream,
+            rank if self_copy else -1)
+        if self_copy:
+            _self_copy(in_array[rank], out_array[rank], stream)
+
+
+def _is_self_copy_possible(in_array, out_array):
+    # The data a rank sends to itself can be copied directly, without
+    # involving NCCL, when both buffers have the same layout in memory
+    return (in_array.dtype == out_array.dtype
+            and in_array.size == out_array.size
+            and in_array.flags.c_contiguous
+            and out_array.flags.c_contiguous)
+
+
+def _self_copy(in_array, out_array, stream):
+    runtime.memcpyAsync(
+        out_array.data.ptr, in_array.data.ptr, in_array.nbytes,
+        runtime.memcpyDeviceToDevice, stream)
 
 
 def _make_sparse_empty(dtype, sparse_type):
@@ -606,6 +808,12 @@ class _SparseNCCLCommunicator:
         cls.reduce(comm, in_array, out_array, root, op, stream)
         cls.broadcast(comm, out_array, root, stream)
 
+    @classmethod
+    def all_reduce_via_rs_ag(
+            cls, comm, in_array, out_array, op='sum', stream=None):
+        # Sparse matrices cannot be split in equally sized shards
+        cls.all_reduce(comm, in_array, out_array, op, stream)
+
     @classmethod
     def reduce(cls, comm, in_array, out_array, root=0, op='sum', stream=None):
         arrays = cls._get_internal_arrays(in_array)
@@ -133,13 +133,18 @@ class _BarrierImpl:
         self._world_size = world_size
         self._cvar = threading.Condition()
 
-    def __call__(self):
-        # Superlame implementation, should be improved
+    def arrive(self):
+        # Returns True for the last process reaching the barrier
         with self._cvar:
             self._world_size -= 1
             if self._world_size == 0:
-                self._cvar.notifyAll()
-            elif self._world_size > 0:
+                self._cvar.notify_all()
+                return True
+            return False
+
+    def wait(self):
+        with self._cvar:
+            while self._world_size > 0:
                 self._cvar.wait()
 
 
@@ -165,12 +170,17 @@ class Barrier:
 
     def __call__(self, store):
         with store._lock:
-            if store._current_barrier is None:
-                store._current_barrier = _BarrierImpl(store._world_size)
-        store._current_barrier()
-        # Once the barrier has been completed, just clean it
-        with store._lock:
-            store._current_barrier = None
+            barrier = store._current_barrier
+            if barrier is None:
+                barrier = _BarrierImpl(store._world_size)
+                store._current_barrier = barrier
+            # The last arrival retires the barrier while holding the lock,
+            # so processes that are released early and enter the next
+            # barrier get a new one instead of the completed one, and the
+            # threads still waking up from this one cannot clear it.
+            if barrier.arrive():
+                store._current_barrier = None
+        barrier.wait()
         return Barrier.BarrierResult()
 
     def decode_result(self, data):
@@ -294,6 +294,7 @@ class _compressed_sparse_matrix(sparse_data._data_matrix,
                              % (len(indptr), major + 1))
 
         self._descr = cusparse.MatDescriptor.create()
+        self._spmat_descr = cusparse._SpMatDescriptorCache()
         self._shape = shape
 
     def _with_data(self, data, copy=True):
@@ -10,6 +10,7 @@ except ImportError:
     _scipy_available = False
 
 import cupy
+import cupyx
 from cupy._core import _accelerator
 from cupy.cuda import cub
 from cupy.cuda import runtime
@@ -21,6 +22,15 @@ from cupyx.scipy.sparse import SparseEfficiencyWarning
 from cupyx.scipy.sparse import _util
 
 
+# Above this number of non-zeros cuSPARSE SpMV is faster than the CUB one.
+_CUB_SPMV_MAX_NNZ = 1000000
+
+# Matrices smaller than this size or with a higher ratio of non-zeros are
+# converted to F-ordered dense arrays without cuSPARSE.
+_CSR2DENSE_MAX_SMALL_SIZE = 1 << 14
+_CSR2DENSE_MIN_DENSITY = 0.25
+
+
 class csr_matrix(_compressed._compressed_sparse_matrix):
 
     """Compressed Sparse Row matrix.
@@ -59,7 +69,9 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
 
         Args:
             stream (cupy.cuda.Stream): CUDA stream object. If it is given, the
-                copy runs asynchronously. Otherwise, the copy is synchronous.
+                three arrays are copied asynchronously to pinned memory on
+                the stream, and the stream is synchronized once all the
+                copies are queued. Otherwise, the copy is synchronous.
 
         Returns:
             scipy.sparse.csr_matrix: Copy of the array on host memory.
@@ -67,9 +79,16 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
         """
         if not _scipy_available:
             raise RuntimeError('scipy is not available')
-        data = self.data.get(stream)
-        indices = self.indices.get(stream)
-        indptr = self.indptr.get(stream)
+        if stream is None:
+            data = self.data.get()
+            indices = self.indices.get()
+            indptr = self.indptr.get()
+        else:
+            data = _get_pinned(self.data, stream)
+            indices = _get_pinned(self.indices, stream)
+            indptr = _get_pinned(self.indptr, stream)
+            # SciPy reads indptr to validate the matrix
+            stream.synchronize()
         return scipy.sparse.csr_matrix(
             (data, indices, indptr), shape=self._shape)
 
@@ -82,7 +101,8 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
 
     def _add_sparse(self, other, alpha, beta):
         self.sum_duplicates()
-        other = other.tocsr()
+        if not isspmatrix_csr(other):
+            other = other.tocsr()
         other.sum_duplicates()
         if cusparse.check_availability('csrgeam2'):
             csrgeam = cusparse.csrgeam2
@@ -145,84 +165,125 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
     def __ge__(self, other):
         return self._comparison(other, operator.ge, '_ge_')
 
-    def __mul__(self, other):
-        if cupy.isscalar(other):
+    def _mul_scalar(self, other):
+        self.sum_duplicates()
+        return self._with_data(self.data * other)
+
+    def _mul_csr(self, other):
+        self.sum_duplicates()
+        other.sum_duplicates()
+        if cusparse.check_availability('spgemm'):
+            return cusparse.spgemm(self, other)
+        elif cusparse.check_availability('csrgemm2'):
+            return cusparse.csrgemm2(self, other)
+        elif cusparse.check_availability('csrgemm'):
+            return cusparse.csrgemm(self, other)
+        else:
+            raise NotImplementedError
+
+    def _mul_csc(self, other):
+        self.sum_duplicates()
+        other.sum_duplicates()
+        if cusparse.check_availability('spgemm'):
+            # cuSPARSE SpGEMM only supports non-transposed operands, so
+            # `other.T` (the CSR view of `other`) cannot be passed with a
+            # transpose flag and an explicit conversion is still needed.
+            b = other.tocsr()
+            b.sum_duplicates()
+            return cusparse.spgemm(self, b)
+        elif (cusparse.check_availability('csrgemm')
+                and not runtime.is_hip):
+            # trans=True is still buggy as of ROCm 4.2.0
+            return cusparse.csrgemm(self, other.T, transb=True)
+        elif cusparse.check_availability('csrgemm2'):
+            b = other.tocsr()
+            b.sum_duplicates()
+            return cusparse.csrgemm2(self, b)
+        else:
+            raise NotImplementedError
+
+    def _mul_sparse(self, other):
+        return self * other.tocsr()
+
+    def _mul_dense(self, other):
+        if other.ndim == 0:
             self.sum_duplicates()
             return self._with_data(self.data * other)
-        elif isspmatrix_csr(other):
+        elif other.ndim == 1:
             self.sum_duplicates()
-            other.sum_duplicates()
-            if cusparse.check_availability('spgemm'):
-                return cusparse.spgemm(self, other)
-            elif cusparse.check_availability('csrgemm2'):
-                return cusparse.csrgemm2(self, other)
-            elif cusparse.check_availability('csrgemm'):
-                return cusparse.csrgemm(self, other)
+            other = cupy.asfortranarray(other)
+            # need extra padding to ensure not stepping on the CUB bug,
+            # see cupy/cupy#3679 for discussion
+            is_cub_safe = (self.indptr.data.mem.size
+                           > self.indptr.size * self.indptr.dtype.itemsize)
+            # CUB spmv is buggy since CUDA 11.0, see
+            # https://github.com/cupy/cupy/issues/3822#issuecomment-782607637
+            is_cub_safe &= (cub._get_cuda_build_version() < 11000)
+            # CUB outperforms cuSPARSE only for small matrices, but it is
+            # the only option for dtypes cuSPARSE does not support
+            is_cub_preferred = (self.nnz < _CUB_SPMV_MAX_NNZ
+                                or self.dtype.char not in 'fdFD')
+            for accelerator in _accelerator.get_routine_accelerators():
+                if (accelerator == _accelerator.ACCELERATOR_CUB
+                        and not runtime.is_hip
+                        and is_cub_safe and is_cub_preferred
+                        and other.flags.c_contiguous):
+                    return cub.device_csrmv(
+                        self.shape[0], self.shape[1], self.nnz,
+                        self.data, self.indptr, self.indices, other)
+            if (cusparse.check_availability('csrmvEx') and self.nnz > 0 and
+                    cusparse.csrmvExIsAligned(self, other)):
+                # csrmvEx does not work if nnz == 0
+                csrmv = cusparse.csrmvEx
+            elif cusparse.check_availability('csrmv'):
+                csrmv = cusparse.csrmv
+            elif cusparse.check_availability('spmv'):
+                csrmv = cusparse.spmv
             else:
                 raise NotImplementedError
-        elif _csc.isspmatrix_csc(other):
+            return csrmv(self, other)
+        elif other.ndim == 2:
             self.sum_duplicates()
-            other.sum_duplicates()
-            if cusparse.check_availability('csrgemm') and not runtime.is_hip:
-                # trans=True is still buggy as of ROCm 4.2.0
-                return cusparse.csrgemm(self, other.T, transb=True)
-            elif cusparse.check_availability('spgemm'):
-                b = other.tocsr()
-                b.sum_duplicates()
-                return cusparse.spgemm(self, b)
-            elif cusparse.check_availability('csrgemm2'):
-                b = other.tocsr()
-                b.sum_duplicates()
-                return cusparse.csrgemm2(self, b)
+            if cusparse.check_availability('csrmm2'):
+                csrmm = cusparse.csrmm2
+            elif cusparse.check_availability('spmm'):
+                csrmm = cusparse.spmm
             else:
                 raise NotImplementedError
+            return csrmm(self, cupy.asfortranarray(other))
+        else:
+            raise ValueError('could not interpret dimensions')
+
+    def _mul_unsupported(self, other):
+        return NotImplemented
+
+    @staticmethod
+    def _resolve_mul_handler(other):
+        if cupy.isscalar(other):
+            return csr_matrix._mul_scalar
+        elif isspmatrix_csr(other):
+            return csr_matrix._mul_csr
+        elif _csc.isspmatrix_csc(other):
+            return csr_matrix._mul_csc
         elif _base.isspmatrix(other):
-            return self * other.tocsr()
+            return csr_matrix._mul_sparse
         elif _base.isdense(other):
-            if other.ndim == 0:
-                self.sum_duplicates()
-                return self._with_data(self.data * other)
-            elif other.ndim == 1:
-                self.sum_duplicates()
-                other = cupy.asfortranarray(other)
-                # need extra padding to ensure not stepping on the CUB bug,
-                # see cupy/cupy#3679 for discussion
-                is_cub_safe = (self.indptr.data.mem.size
-                               > self.indptr.size * self.indptr.dtype.itemsize)
-                # CUB spmv is buggy since CUDA 11.0, see
-                # https://github.com/cupy/cupy/issues/3822#issuecomment-782607637
-                is_cub_safe &= (cub._get_cuda_build_version() < 11000)
-                for accelerator in _accelerator.get_routine_accelerators():
-                    if (accelerator == _accelerator.ACCELERATOR_CUB
-                            and not runtime.is_hip
-                            and is_cub_safe and other.flags.c_contiguous):
-                        return cub.device_csrmv(
-                            self.shape[0], self.shape[1], self.nnz,
-                            self.data, self.indptr, self.indices, other)
-                if (cusparse.check_availability('csrmvEx') and self.nnz > 0 and
-                        cusparse.csrmvExIsAligned(self, other)):
-                    # csrmvEx does not work if nnz == 0
-                    csrmv = cusparse.csrmvEx
-                elif cusparse.check_availability('csrmv'):
-                    csrmv = cusparse.csrmv
-                elif cusparse.check_availability('spmv'):
-                    csrmv = cusparse.spmv
-                else:
-                    raise NotImplementedError
-                return csrmv(self, other)
-            elif other.ndim == 2:
-                self.sum_duplicates()
-                if cusparse.check_availability('csrmm2'):
-                    csrmm = cusparse.csrmm2
-                elif cusparse.check_availability('spmm'):
-                    csrmm = cusparse.spmm
-                else:
-                    raise NotImplementedError
-                return csrmm(self, cupy.asfortranarray(other))
-            else:
-                raise ValueError('could not interpret dimensions')
+            return csr_matrix._mul_dense
         else:
-            return NotImplemented
+            return csr_matrix._mul_unsupported
+
+    # Maps the type of the right operand to the handler chosen by
+    # `_resolve_mul_handler`. All the checks done there only depend on the
+    # type of the operand, so the result can be reused for later calls.
+    _mul_handlers = {}
+
+    def __mul__(self, other):
+        kind = type(other)
+        handler = csr_matrix._mul_handlers.get(kind)
+        if handler is None:
+            handler = csr_matrix._resolve_mul_handler(other)
+            csr_matrix._mul_handlers[kind] = handler
+        return handler(self, other)
 
     def __div__(self, other):
         raise NotImplementedError
@@ -400,25 +461,26 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
         x = self.copy()
         x.has_canonical_format = False  # need to enforce sum_duplicates
         x.sum_duplicates()
+        if order == 'C':
+            # cuSPARSE only returns F-contiguous arrays. Scattering the
+            # elements directly into a C-contiguous array avoids the extra
+            # transpose copy.
+            return csr2dense(x, order)
+        elif order != 'F':
+            raise ValueError('order not understood')
+        m, n = x.shape
+        if (m * n < _CSR2DENSE_MAX_SMALL_SIZE
+                or x.nnz > _CSR2DENSE_MIN_DENSITY * m * n):
+            # For small or rather dense matrices the cost is dominated by
+            # the cuSPARSE overhead or by writing the output, respectively,
+            # so a plain scatter is at least as fast.
+            return csr2dense(x, order)
         if (cusparse.check_availability('sparseToDense')
                 and (not runtime.is_hip or (x.nnz > 0))):
             # On HIP, nnz=0 is problematic as of ROCm 4.2.0
-            y = cusparse.sparseToDense(x)
-            if order == 'F':
-                return y
-            elif order == 'C':
-                return cupy.ascontiguousarray(y)
-            else:
-                raise ValueError('order not understood')
+            return cusparse.sparseToDense(x)
         else:
-            # csr2dense returns F-contiguous array.
-            if order == 'C':
-                # To return C-contiguous array, it uses transpose.
-                return cusparse.csc2dense(x.T).T
-            elif order == 'F':
-                return cusparse.csr2dense(x)
-            else:
-                raise ValueError('order not understood')
+            return cusparse.csr2dense(x)
 
     def tobsr(self, blocksize=None, copy=False):
         # TODO(unno): Implement tobsr
@@ -574,6 +636,12 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
         return self._major_index_fancy(row)._minor_slice(col)
 
 
+def _get_pinned(a, stream):
+    if a.size == 0:
+        return a.get(stream)
+    return a.get(stream, out=cupyx.empty_like_pinned(a))
+
+
 def isspmatrix_csr(x):
     """Checks if a given matrix is of CSR format.
 
@@ -1122,9 +1190,9 @@ def cupy_csr2dense():
         int row = get_row_id(i, 0, M - 1, &(INDPTR[0]));
         int col = INDICES;
         if (C_ORDER) {
-            OUT[col + N * row] += DATA;
+            OUT[col + static_cast<ptrdiff_t>(N) * row] += DATA;
         } else {
-            OUT[row + M * col] += DATA;
+            OUT[row + static_cast<ptrdiff_t>(M) * col] += DATA;
         }
         ''',
         'cupyx_scipy_sparse_csr2dense',
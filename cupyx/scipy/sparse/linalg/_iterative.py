@@ -360,7 +360,7 @@ def _make_fast_matvec(A):
         alg = _cusparse.CUSPARSE_MV_ALG_DEFAULT
         x = cupy.empty((A.shape[0],), dtype=A.dtype)
         y = cupy.empty((A.shape[0],), dtype=A.dtype)
-        desc_A = cusparse.SpMatDescriptor.create(A)
+        desc_A = cusparse._get_spmat_descriptor(A)
         desc_x = cusparse.DnVecDescriptor.create(x)
         desc_y = cusparse.DnVecDescriptor.create(y)
         buff_size = _cusparse.spMV_bufferSize(
@@ -390,6 +390,18 @@ class TestSpgemm:
         expect = self.alpha * self.a.dot(self.b)
         testing.assert_array_almost_equal(c.toarray(), expect.toarray())
 
+    def test_spgemm_empty(self):
+        if not cupy.cusparse.check_availability('spgemm'):
+            pytest.skip('spgemm is not available.')
+
+        m, n, k = self.shape
+        a = sparse.csr_matrix((m, k), dtype=self.dtype)
+        b = sparse.csr_matrix(self.b)
+        c = cupy.cusparse.spgemm(a, b, alpha=self.alpha)
+        assert c.shape == (m, n)
+        assert c.nnz == 0
+        assert c.dtype == self.dtype
+
 
 @testing.with_requires('scipy')
 class TestSpgemmInvalidCases:
@@ -676,6 +688,49 @@ class TestSpmv:
         assert y is z
         testing.assert_array_almost_equal(y, expect)
 
+    def test_spmv_replaced_data(self):
+        if not cupy.cusparse.check_availability('spmv'):
+            pytest.skip('spmv is not available')
+        if runtime.is_hip:
+            if ((self.format == 'csr' and self.transa is True)
+                    or (self.format == 'csc' and self.transa is False)
+                    or (self.format == 'coo' and self.transa is True)):
+                pytest.xfail('may be buggy')
+
+        a = self.sparse_matrix(self.a)
+        if not a.has_canonical_format:
+            a.sum_duplicates()
+        x = cupy.array(self.x)
+        y = cupy.cusparse.spmv(a, x, alpha=self.alpha, transa=self.transa)
+        expect = self.alpha * self.op_a.dot(self.x)
+        testing.assert_array_almost_equal(y, expect)
+        # a cached descriptor must not refer to the previous buffer
+        a.data = a.data * 2
+        y = cupy.cusparse.spmv(a, x, alpha=self.alpha, transa=self.transa)
+        testing.assert_array_almost_equal(y, 2 * expect)
+
+    def test_spmv_reused_descriptor(self):
+        if not cupy.cusparse.check_availability('spmv'):
+            pytest.skip('spmv is not available')
+        if self.format != 'csr':
+            pytest.skip('descriptors are only cached for csr matrices')
+        if runtime.is_hip and self.transa is True:
+            pytest.xfail('may be buggy')
+
+        a = self.sparse_matrix(self.a)
+        if not a.has_canonical_format:
+            a.sum_duplicates()
+        x = cupy.array(self.x)
+        expect = self.alpha * self.op_a.dot(self.x)
+        # the descriptor of an unchanged matrix is created only once
+        with testing.AssertFunctionIsCalled(
+                'cupy.cusparse.SpMatDescriptor.create',
+                wraps=cusparse.SpMatDescriptor.create, times_called=1):
+            for _ in range(2):
+                y = cupy.cusparse.spmv(
+                    a, x, alpha=self.alpha, transa=self.transa)
+                testing.assert_array_almost_equal(y, expect)
+
 
 @testing.with_requires('scipy')
 class TestErrorSpmv:
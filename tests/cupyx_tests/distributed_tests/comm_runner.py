@@ -2,6 +2,8 @@ import sys
 import time
 import warnings
 
+import pytest
+
 import cupy
 from cupy import cuda
 from cupy.cuda import nccl
@@ -105,6 +107,85 @@ def all_reduce(dtype, use_mpi=False):
         _launch_workers(run_all_reduce, (dtype,))
 
 
+def all_reduce_complex(dtype, use_mpi=False):
+    def run_all_reduce_complex(rank, dtype, use_mpi=False):
+        dev = cuda.Device(rank)
+        dev.use()
+        comm = NCCLBackend(N_WORKERS, rank, use_mpi=use_mpi)
+        base = cupy.arange(2 * 3 * 4, dtype=dtype).reshape(2, 3, 4)
+        base = base + 1j * (base + 1)
+        in_array = (rank + 1) * base
+        out_array = cupy.zeros((2, 3, 4), dtype=dtype)
+
+        comm.all_reduce(in_array, out_array)
+        expected = (N_WORKERS * (N_WORKERS + 1) // 2) * base
+        testing.assert_allclose(out_array, expected)
+        # Only the sum is supported for complex arrays
+        with pytest.raises(ValueError):
+            comm.all_reduce(in_array, out_array, 'prod')
+
+    if use_mpi:
+        from mpi4py import MPI
+        # This process was run with mpiexec
+        run_all_reduce_complex(MPI.COMM_WORLD.Get_rank(), dtype, True)
+    else:
+        _launch_workers(run_all_reduce_complex, (dtype,))
+
+
+def all_reduce_f_contiguous(dtype, use_mpi=False):
+    if dtype in 'hH':
+        return  # nccl does not support int16
+
+    def run_all_reduce_f_contiguous(rank, dtype, use_mpi=False):
+        dev = cuda.Device(rank)
+        dev.use()
+        comm = NCCLBackend(N_WORKERS, rank, use_mpi=use_mpi)
+        in_array = cupy.asfortranarray(
+            cupy.arange(2 * 3 * 4, dtype='f').reshape(2, 3, 4))
+        out_array = cupy.zeros((2, 3, 4), dtype='f', order='F')
+
+        comm.all_reduce(in_array, out_array)
+        testing.assert_allclose(out_array, 2 * in_array)
+
+    if use_mpi:
+        from mpi4py import MPI
+        # This process was run with mpiexec
+        run_all_reduce_f_contiguous(MPI.COMM_WORLD.Get_rank(), dtype, True)
+    else:
+        _launch_workers(run_all_reduce_f_contiguous, (dtype,))
+
+
+def all_reduce_via_rs_ag(dtype, use_mpi=False):
+    if dtype in 'hH':
+        return  # nccl does not support int16
+
+    def run_all_reduce_via_rs_ag(rank, dtype, use_mpi=False):
+        dev = cuda.Device(rank)
+        dev.use()
+        comm = NCCLBackend(N_WORKERS, rank, use_mpi=use_mpi)
+        in_array = (rank + 1) * cupy.arange(
+            N_WORKERS * 12, dtype='f').reshape(N_WORKERS, 3, 4)
+        out_array = cupy.zeros((N_WORKERS, 3, 4), dtype='f')
+
+        comm.all_reduce_via_rs_ag(in_array, out_array)
+        expected = (N_WORKERS * (N_WORKERS + 1) // 2) * cupy.arange(
+            N_WORKERS * 12, dtype='f').reshape(N_WORKERS, 3, 4)
+        testing.assert_allclose(out_array, expected)
+
+        # Mismatched outputs are rejected before launching any collective
+        with pytest.raises(ValueError):
+            comm.all_reduce_via_rs_ag(in_array, out_array[:1])
+        with pytest.raises(ValueError):
+            comm.all_reduce_via_rs_ag(in_array, out_array.astype('d'))
+
+    if use_mpi:
+        from mpi4py import MPI
+        # This process was run with mpiexec
+        run_all_reduce_via_rs_ag(MPI.COMM_WORLD.Get_rank(), dtype, True)
+    else:
+        _launch_workers(run_all_reduce_via_rs_ag, (dtype,))
+
+
 def reduce_scatter(dtype, use_mpi=False):
     if dtype in 'hH':
         return  # nccl does not support int16
@@ -212,8 +293,7 @@ def scatter(dtype, use_mpi=False):
         out_array = cupy.zeros((10,), dtype='f')
 
         comm.scatter(in_array, out_array, root)
-        if rank > 0:
-            testing.assert_allclose(out_array, in_array[rank])
+        testing.assert_allclose(out_array, in_array[rank])
 
     if use_mpi:
         from mpi4py import MPI
@@ -297,6 +377,43 @@ def barrier(use_mpi=False):
         _launch_workers(run_barrier)
 
 
+def cpu_broadcast(use_mpi=False):
+    def run_cpu_broadcast(rank, use_mpi=False):
+        dev = cuda.Device(rank)
+        dev.use()
+        comm = NCCLBackend(N_WORKERS, rank, use_mpi=use_mpi)
+        for root in range(N_WORKERS):
+            value = comm.cpu_broadcast(
+                1234 + root if rank == root else None, root)
+            assert value == 1234 + root
+        value = comm.cpu_broadcast(b'abc' if rank == 0 else None)
+        assert value == b'abc'
+        value = comm.cpu_broadcast(-1 if rank == 0 else None)
+        assert value == -1
+        value = comm.cpu_broadcast(2 ** 64 if rank == 1 else None, 1)
+        assert value == 2 ** 64
+        # An invalid value raises in every rank instead of hanging them
+        if rank == 0:
+            with pytest.raises(ValueError):
+                comm.cpu_broadcast(b'x' * 1000)
+        else:
+            with pytest.raises(RuntimeError):
+                comm.cpu_broadcast(None)
+        assert comm.cpu_broadcast(7 if rank == 0 else None) == 7
+        # Back to back calls reuse the store barrier and the value slots
+        for i in range(200):
+            root = i % N_WORKERS
+            value = comm.cpu_broadcast(i if rank == root else None, root)
+            assert value == i
+
+    if use_mpi:
+        from mpi4py import MPI
+        # This process was run with mpiexec
+        run_cpu_broadcast(MPI.COMM_WORLD.Get_rank(), True)
+    else:
+        _launch_workers(run_cpu_broadcast)
+
+
 def init(use_mpi=False):
     def run_init(rank, use_mpi=False):
         dev = cuda.Device(rank)
@@ -70,6 +70,18 @@ class TestNCCLBackend:
     def test_all_reduce(self, dtype):
         self._run_test('all_reduce', dtype)
 
+    @testing.for_dtypes('FD')
+    def test_all_reduce_complex(self, dtype):
+        self._run_test('all_reduce_complex', dtype)
+
+    @testing.for_all_dtypes(no_bool=True)
+    def test_all_reduce_f_contiguous(self, dtype):
+        self._run_test('all_reduce_f_contiguous', dtype)
+
+    @testing.for_all_dtypes(no_bool=True)
+    def test_all_reduce_via_rs_ag(self, dtype):
+        self._run_test('all_reduce_via_rs_ag', dtype)
+
     @testing.for_all_dtypes(no_bool=True)
     def test_reduce_scatter(self, dtype):
         self._run_test('reduce_scatter', dtype)
@@ -101,6 +113,9 @@ class TestNCCLBackend:
     def test_barrier(self):
         self._run_test('barrier', None)
 
+    def test_cpu_broadcast(self):
+        self._run_test('cpu_broadcast', None)
+
 
 @pytest.mark.skipif(not _mpi_available, reason='mpi is not installed')
 @testing.multi_gpu(2)
@@ -1,3 +1,4 @@
+import multiprocessing
 import unittest
 
 import pytest
@@ -10,6 +11,12 @@ from cupyx.distributed import _store
 nccl_available = nccl.available
 
 
+def _run_barriers(n_barriers):
+    proxy = _store.TCPStoreProxy()
+    for _ in range(n_barriers):
+        proxy.barrier()
+
+
 @pytest.mark.skipif(not nccl_available, reason='nccl is not installed')
 class TestTCPStore(unittest.TestCase):
 
@@ -40,4 +47,25 @@ class TestTCPStore(unittest.TestCase):
                 a = proxy[123]  # NOQA
         finally:
             store.stop()
-    # Barrier is tested directly in the communicators
+
+    @_condition.retry(10)
+    def test_store_repeated_barrier(self):
+        world_size = 2
+        store = _store.TCPStore(world_size)
+        try:
+            store.run()
+            workers = [
+                multiprocessing.Process(target=_run_barriers, args=(200,))
+                for _ in range(world_size)]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join(60)
+            hung = [w for w in workers if w.is_alive()]
+            for w in hung:
+                w.terminate()
+            assert not hung
+            assert all(w.exitcode == 0 for w in workers)
+        finally:
+            store.stop()
+    # Barrier is also tested directly in the communicators
@@ -1,6 +1,7 @@
 import contextlib
 import pickle
 import warnings
+from unittest import mock
 
 import numpy
 import pytest
@@ -288,6 +289,18 @@ class TestCsrMatrix:
         ]
         numpy.testing.assert_allclose(m.toarray(), expect)
 
+    @testing.with_requires('scipy')
+    def test_get_with_stream(self):
+        with cupy.cuda.Stream() as stream:
+            m = self.m.get(stream)
+        assert isinstance(m, scipy.sparse.csr_matrix)
+        expect = [
+            [0, 1, 0, 0],
+            [0, 0, 0, 2],
+            [0, 0, 3, 0]
+        ]
+        numpy.testing.assert_allclose(m.toarray(), expect)
+
     @testing.with_requires('scipy')
     def test_str(self):
         if numpy.dtype(self.dtype).kind == 'f':
@@ -1761,6 +1774,31 @@ class TestCsrMatrixGetitem2:
         return _make(xp, sp, self.dtype)[None:4]
 
 
+@testing.parameterize(*testing.product({
+    'dtype': [numpy.float32, numpy.float64, numpy.complex64, numpy.complex128],
+    'density': [0.01, 0.5],
+    'order': ['C', 'F'],
+}))
+@testing.with_requires('scipy')
+@testing.gpu
+class TestCsrMatrixToarrayDensity:
+
+    # Large enough for the sparse case to be converted by cuSPARSE
+    shape = (200, 150)
+
+    @testing.numpy_cupy_allclose(sp_name='sp')
+    def test_toarray(self, xp, sp):
+        m = scipy.sparse.random(
+            *self.shape, density=self.density, format='csr',
+            random_state=0).astype(self.dtype)
+        a = sp.csr_matrix(m).toarray(order=self.order)
+        if self.order == 'C':
+            assert a.flags.c_contiguous
+        else:
+            assert a.flags.f_contiguous
+        return a
+
+
 # CUB SpMV works only when the matrix size is nonzero
 @testing.parameterize(*testing.product({
     'make_method': ['_make', '_make_unordered', '_make_duplicate'],
@@ -1802,6 +1840,20 @@ class TestCubSpmv:
         # ...then perform the actual computation
         return m * x
 
+    @testing.numpy_cupy_allclose(sp_name='sp')
+    def test_mul_dense_vector_large_nnz(self, xp, sp):
+        m = self.make(xp, sp, self.dtype)
+        x = xp.arange(4).astype(self.dtype)
+        if xp is numpy:
+            return m * x
+
+        # pretend the matrix is too large for CUB to be faster than cuSPARSE
+        func = 'cupyx.scipy.sparse._csr.cub.device_csrmv'
+        with mock.patch('cupyx.scipy.sparse._csr._CUB_SPMV_MAX_NNZ', 0):
+            with testing.AssertFunctionIsCalled(func, times_called=0):
+                y = m * x
+        return y
+
 
 @testing.parameterize(*testing.product({
     'a_dtype': ['float32', 'float64', 'complex64', 'complex128'],